@@ -1,29 +1,24 @@
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
-from python_sql_queries import TorontoParkingDB
 import os
 
-# Set style for better-looking charts
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (14, 6)
 
-# Ensure output directories exist
-os.makedirs('visuals', exist_ok=True)
-os.makedirs('sql_outputs', exist_ok=True)
+def setup_style():
+    """Set style for better-looking charts"""
+    sns.set_style("whitegrid")
+    plt.rcParams['figure.figsize'] = (14, 6)
+
 
 # ============================================
 # CHART 1: Top 15 Infraction Types
 # ============================================
 
-def create_chart1_top_infractions():
+def create_chart1_top_infractions(db, visuals_dir='visuals'):
     """Chart 1: Top 15 Infraction Types - Horizontal Bar Chart"""
     print("📊 Creating Chart 1: Top Infractions...")
     
-    db = TorontoParkingDB(password='1234567890')
-    db.connect()
     df = db.get_top_infractions(limit=15)
-    db.disconnect()
     
     if df is None or len(df) == 0:
         print("❌ No data for Chart 1")
@@ -45,7 +40,7 @@ def create_chart1_top_infractions():
         ax.text(v + 200, i, str(int(v)), va='center')
     
     plt.tight_layout()
-    plt.savefig('visuals/chart1_top_infractions.png', dpi=300, bbox_inches='tight')
+    plt.savefig(os.path.join(visuals_dir, 'chart1_top_infractions.png'), dpi=300, bbox_inches='tight')
     print("✓ Chart 1 saved: chart1_top_infractions.png")
     plt.close()
 
@@ -54,14 +49,11 @@ def create_chart1_top_infractions():
 # CHART 2: Fine Amount Distribution (Pie Chart)
 # ============================================
 
-def create_chart2_fine_distribution():
+def create_chart2_fine_distribution(db, visuals_dir='visuals'):
     """Chart 2: Fine Amount Distribution - Pie Chart"""
     print("📊 Creating Chart 2: Fine Distribution...")
     
-    db = TorontoParkingDB(password='1234567890')
-    db.connect()
     df = db.get_fine_distribution()
-    db.disconnect()
     
     if df is None or len(df) == 0:
         print("❌ No data for Chart 2")
@@ -90,7 +82,7 @@ def create_chart2_fine_distribution():
     ax.set_title('Distribution of Parking Fine Amounts', fontsize=14, fontweight='bold', pad=20)
     
     plt.tight_layout()
-    plt.savefig('visuals/chart2_fine_distribution.png', dpi=300, bbox_inches='tight')
+    plt.savefig(os.path.join(visuals_dir, 'chart2_fine_distribution.png'), dpi=300, bbox_inches='tight')
     print("✓ Chart 2 saved: chart2_fine_distribution.png")
     plt.close()
 
@@ -99,14 +91,11 @@ def create_chart2_fine_distribution():
 # CHART 3: Monthly Trend (Line Chart)
 # ============================================
 
-def create_chart3_temporal_trend():
+def create_chart3_temporal_trend(db, visuals_dir='visuals'):
     """Chart 3: Monthly Trend - Line Chart"""
     print("📊 Creating Chart 3: Temporal Trend...")
     
-    db = TorontoParkingDB(password='1234567890')
-    db.connect()
     df = db.get_by_date()
-    db.disconnect()
     
     if df is None or len(df) == 0:
         print("❌ No data for Chart 3")
@@ -134,7 +123,7 @@ def create_chart3_temporal_trend():
     plt.xticks(rotation=45, ha='right')
     
     plt.tight_layout()
-    plt.savefig('visuals/chart3_temporal_trend.png', dpi=300, bbox_inches='tight')
+    plt.savefig(os.path.join(visuals_dir, 'chart3_temporal_trend.png'), dpi=300, bbox_inches='tight')
     print("✓ Chart 3 saved: chart3_temporal_trend.png")
     plt.close()
 
@@ -143,14 +132,11 @@ def create_chart3_temporal_trend():
 # CHART 4: Average Fine by Infraction (Horizontal Bar)
 # ============================================
 
-def create_chart4_avg_fine_by_infraction():
+def create_chart4_avg_fine_by_infraction(db, visuals_dir='visuals'):
     """Chart 4: Average Fine Amount by Infraction - Horizontal Bar Chart"""
     print("📊 Creating Chart 4: Average Fine by Infraction...")
     
-    db = TorontoParkingDB(password='1234567890')
-    db.connect()
     df = db.get_top_infractions(limit=15)
-    db.disconnect()
     
     if df is None or len(df) == 0:
         print("❌ No data for Chart 4")
@@ -174,7 +160,7 @@ def create_chart4_avg_fine_by_infraction():
         ax.text(v + 2, i, f'${v:.2f}', va='center')
     
     plt.tight_layout()
-    plt.savefig('visuals/chart4_avg_fine_by_infraction.png', dpi=300, bbox_inches='tight')
+    plt.savefig(os.path.join(visuals_dir, 'chart4_avg_fine_by_infraction.png'), dpi=300, bbox_inches='tight')
     print("✓ Chart 4 saved: chart4_avg_fine_by_infraction.png")
     plt.close()
 
@@ -183,13 +169,10 @@ def create_chart4_avg_fine_by_infraction():
 # CHART 5: Day of Week Analysis (Bar Chart)
 # ============================================
 
-def create_chart5_day_of_week():
+def create_chart5_day_of_week(db, visuals_dir='visuals'):
     """Chart 5: Day of Week Analysis - Bar Chart"""
     print("📊 Creating Chart 5: Day of Week Analysis...")
     
-    db = TorontoParkingDB(password='1234567890')
-    db.connect()
-    
     # Custom query for day of week
     query = """
     SELECT 
@@ -203,7 +186,6 @@ def create_chart5_day_of_week():
     """
     
     df = db.query_to_dataframe(query)
-    db.disconnect()
     
     if df is None or len(df) == 0:
         print("❌ No data for Chart 5")
@@ -227,7 +209,7 @@ def create_chart5_day_of_week():
     
     plt.xticks(rotation=0)
     plt.tight_layout()
-    plt.savefig('visuals/chart5_day_of_week.png', dpi=300, bbox_inches='tight')
+    plt.savefig(os.path.join(visuals_dir, 'chart5_day_of_week.png'), dpi=300, bbox_inches='tight')
     print("✓ Chart 5 saved: chart5_day_of_week.png")
     plt.close()
 
@@ -236,59 +218,82 @@ def create_chart5_day_of_week():
 # SUMMARY STATISTICS
 # ============================================
 
-def create_summary_stats():
+def create_summary_stats(db, sql_outputs_dir='sql_outputs'):
     """Generate and save summary statistics to text file"""
     print("📄 Creating Summary Statistics...")
     
-    db = TorontoParkingDB(password='1234567890')
-    db.connect()
-    
     stats = db.get_summary_stats()
-    db.disconnect()
     
     if stats is None or len(stats) == 0:
         print("❌ No data for summary statistics")
         return
     
     # Save as text file
-    with open('sql_outputs/summary_statistics.txt', 'w') as f:
+    summary_path = os.path.join(sql_outputs_dir, 'summary_statistics.txt')
+    with open(summary_path, 'w') as f:
         f.write("=" * 60 + "\n")
         f.write("TORONTO PARKING ANALYSIS - SUMMARY STATISTICS\n")
         f.write("=" * 60 + "\n\n")
         f.write(stats.to_string(index=False))
         f.write("\n\n" + "=" * 60 + "\n")
     
-    print("✓ Summary statistics saved: sql_outputs/summary_statistics.txt")
+    print(f"✓ Summary statistics saved: {summary_path}")
     print(f"\n{stats.to_string(index=False)}\n")
 
 
+# ============================================
+# RUN ALL
+# ============================================
+
+def run_analysis(mysql_config, visuals_dir='visuals', sql_outputs_dir='sql_outputs'):
+    """Create summary statistics and all 5 charts using one database connection"""
+    from python_sql_queries import TorontoParkingDB
+
+    setup_style()
+
+    # Ensure output directories exist
+    os.makedirs(visuals_dir, exist_ok=True)
+    os.makedirs(sql_outputs_dir, exist_ok=True)
+
+    db = TorontoParkingDB(**mysql_config)
+    db.connect()
+
+    try:
+        # Create summary stats first
+        create_summary_stats(db, sql_outputs_dir)
+
+        # Create all 5 charts
+        print("\n📊 Creating visualizations...\n")
+        create_chart1_top_infractions(db, visuals_dir)
+        create_chart2_fine_distribution(db, visuals_dir)
+        create_chart3_temporal_trend(db, visuals_dir)
+        create_chart4_avg_fine_by_infraction(db, visuals_dir)
+        create_chart5_day_of_week(db, visuals_dir)
+    finally:
+        db.disconnect()
+
+    print("\n" + "=" * 60)
+    print("✅ All analysis complete!")
+    print(f"📁 Check '{visuals_dir}' folder for charts")
+    print(f"📄 Check '{sql_outputs_dir}' folder for statistics")
+    print("=" * 60)
+
+
 # ============================================
 # MAIN
 # ============================================
 
 if __name__ == "__main__":
+    from config import load_config
+
     print("🚗 Toronto Parking Analysis - Advanced Analysis\n")
     print("=" * 60)
     
     try:
-        # Create summary stats first
-        create_summary_stats()
-        
-        # Create all 5 charts
-        print("\n📊 Creating visualizations...\n")
-        create_chart1_top_infractions()
-        create_chart2_fine_distribution()
-        create_chart3_temporal_trend()
-        create_chart4_avg_fine_by_infraction()
-        create_chart5_day_of_week()
-        
-        print("\n" + "=" * 60)
-        print("✅ All analysis complete!")
-        print("📁 Check 'visuals/' folder for charts")
-        print("📄 Check 'sql_outputs/' folder for statistics")
-        print("=" * 60)
+        config = load_config()
+        run_analysis(config['mysql'], config['visuals_dir'], config['sql_outputs_dir'])
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+        traceback.print_exc()
@@ -0,0 +1,256 @@
+"""Toronto Parking Analysis - command-line entry point
+
+Usage:
+    python scripts/cli.py clean
+    python scripts/cli.py upload
+    python scripts/cli.py query top-infractions --limit 15
+    python scripts/cli.py report --source all
+    python scripts/cli.py serve --port 8765
+    python scripts/cli.py loadtest --duration 10
+    python scripts/cli.py bench
+
+Heavy libraries (pandas, matplotlib, seaborn, mysql.connector) are only
+imported inside the subcommand that needs them, so --help and bench start fast.
+Paths and MySQL credentials come from config.py (JSON file or env vars).
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from config import load_config
+
+# Libraries that must NOT be loaded just to build the parser / show help
+HEAVY_MODULES = ['pandas', 'numpy', 'matplotlib', 'seaborn', 'mysql.connector']
+
+# Lightweight commands timed by `bench` (they never touch data or the database)
+LIGHT_COMMANDS = [
+    ['--help'],
+    ['clean', '--help'],
+    ['query', '--help'],
+    ['report', '--help'],
+    ['serve', '--help'],
+]
+
+# Cold-start budget for lightweight commands (seconds, median of runs)
+DEFAULT_BUDGET = 0.5
+
+QUERIES = ['summary', 'top-infractions', 'by-date', 'by-ward', 'fines']
+
+
+# ============================================
+# SUBCOMMANDS
+# ============================================
+
+def cmd_clean(args, config):
+    """Clean the raw CSV and save the cleaned CSV"""
+    from data_cleaning import run_cleaning
+
+    run_cleaning(args.input or config['raw_csv'], args.output or config['cleaned_csv'])
+    return 0
+
+
+def cmd_upload(args, config):
+    """Upload the cleaned CSV into MySQL"""
+    from db_upload import run_upload
+
+    print("🚗 Toronto Parking Analysis - Database Upload\n")
+    run_upload(args.csv or config['cleaned_csv'], config['mysql'])
+    print("\n✅ Upload complete!")
+    return 0
+
+
+def cmd_query(args, config):
+    """Run one of the pre-built queries (or raw SQL) and print / save the result"""
+    from python_sql_queries import TorontoParkingDB
+
+    db = TorontoParkingDB(**config['mysql'])
+    if not db.connect():
+        return 1
+
+    try:
+        if args.sql:
+            df = db.query_to_dataframe(args.sql)
+        elif args.name == 'summary':
+            df = db.get_summary_stats()
+        elif args.name == 'top-infractions':
+            df = db.get_top_infractions(limit=args.limit)
+        elif args.name == 'by-date':
+            df = db.get_by_date()
+        elif args.name == 'by-ward':
+            df = db.get_by_ward()
+        else:
+            df = db.get_fine_distribution()
+    finally:
+        db.disconnect()
+
+    if df is None:
+        return 1
+
+    if args.output:
+        df.to_csv(args.output, index=False)
+        print(f"✓ Results saved to: {args.output}")
+    else:
+        print(df.to_string(index=False))
+    return 0
+
+
+def cmd_report(args, config):
+    """Create the charts and summary statistics"""
+    if args.source in ('db', 'all'):
+        from advanced_analysis import run_analysis
+
+        print("🚗 Toronto Parking Analysis - Advanced Analysis\n")
+        print("=" * 60)
+        run_analysis(config['mysql'], config['visuals_dir'], config['sql_outputs_dir'])
+
+    if args.source in ('csv', 'all'):
+        from insights import run_insights
+
+        run_insights(config['cleaned_csv'], config['visuals_dir'])
+        print(f"✓ Insight charts saved to: {config['visuals_dir']}")
+    return 0
+
+
+def cmd_serve(args, config):
+    """Serve the aggregates from in-memory hot tables over HTTP/JSON"""
+    from query_service import serve
+
+    serve(args.csv or config['cleaned_csv'], host=args.host, port=args.port,
+          watch_interval=args.watch_interval, quiet=not args.verbose)
+    return 0
+
+
+def cmd_loadtest(args, config):
+    """Load test a running query service"""
+    from load_test import print_report, run_load_test
+
+    result = run_load_test(args.url, args.duration, args.concurrency)
+    print_report(result, args.duration, args.concurrency)
+    return 1 if result['errors'] else 0
+
+
+def check_heavy_imports():
+    """Return heavy modules loaded by importing this CLI and building its parser"""
+    code = (
+        "import sys, cli; cli.build_parser(); "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    )
+    return [m for m in result.stdout.strip().split(',') if m]
+
+
+def time_command(argv, runs):
+    """Median wall-clock time (seconds) to start a fresh interpreter and run argv"""
+    cli_path = os.path.abspath(__file__)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, cli_path] + argv,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def cmd_bench(args, config):
+    """Measure cold-start time of the lightweight commands against a budget"""
+    print(f"⏱  Cold-start benchmark ({args.runs} runs each, budget {args.budget:.3f}s)\n")
+
+    failed = False
+    for argv in LIGHT_COMMANDS:
+        median = time_command(argv, args.runs)
+        ok = median <= args.budget
+        failed = failed or not ok
+        print(f"  {'✓' if ok else '✗'} cli.py {' '.join(argv):<16} {median * 1000:8.1f} ms")
+
+    heavy = check_heavy_imports()
+    if heavy:
+        failed = True
+        print(f"\n✗ Heavy modules imported at startup: {', '.join(heavy)}")
+    else:
+        print("\n✓ No heavy modules imported at startup")
+
+    if failed:
+        print("\n❌ Cold-start budget exceeded")
+        return 1
+    print("\n✅ All lightweight commands within budget")
+    return 0
+
+
+# ============================================
+# PARSER
+# ============================================
+
+def build_parser():
+    """Build the argument parser (no heavy imports here)"""
+    parser = argparse.ArgumentParser(
+        prog='cli.py',
+        description='Toronto Parking Analysis command-line tool'
+    )
+    parser.add_argument('--config', help='path to a JSON config file (default: $PARKING_CONFIG)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    clean = subparsers.add_parser('clean', help='clean the raw parking tags CSV')
+    clean.add_argument('--input', help='raw CSV path (default: raw_csv from config)')
+    clean.add_argument('--output', help='cleaned CSV path (default: cleaned_csv from config)')
+    clean.set_defaults(func=cmd_clean)
+
+    upload = subparsers.add_parser('upload', help='upload the cleaned CSV to MySQL')
+    upload.add_argument('--csv', help='cleaned CSV path (default: cleaned_csv from config)')
+    upload.set_defaults(func=cmd_upload)
+
+    query = subparsers.add_parser('query', help='run a pre-built query against MySQL')
+    query.add_argument('name', nargs='?', choices=QUERIES, default='summary',
+                       help='pre-built query to run (default: summary)')
+    query.add_argument('--limit', type=int, default=10, help='rows for top-infractions (default: 10)')
+    query.add_argument('--sql', help='run this raw SELECT query instead')
+    query.add_argument('--output', help='save results to this CSV file instead of printing')
+    query.set_defaults(func=cmd_query)
+
+    report = subparsers.add_parser('report', help='create charts and summary statistics')
+    report.add_argument('--source', choices=['db', 'csv', 'all'], default='db',
+                        help='db: MySQL charts, csv: charts from cleaned CSV, all: both (default: db)')
+    report.set_defaults(func=cmd_report)
+
+    serve = subparsers.add_parser('serve', help='serve aggregates from memory over HTTP/JSON')
+    serve.add_argument('--csv', help='cleaned CSV path (default: cleaned_csv from config)')
+    serve.add_argument('--host', default='127.0.0.1', help='bind address (default: 127.0.0.1)')
+    serve.add_argument('--port', type=int, default=8765, help='port (default: 8765)')
+    serve.add_argument('--watch-interval', type=float, default=5.0,
+                       help='seconds between checks for a new cleaned CSV, 0 to disable (default: 5)')
+    serve.add_argument('--verbose', action='store_true', help='log every request')
+    serve.set_defaults(func=cmd_serve)
+
+    loadtest = subparsers.add_parser('loadtest', help='measure p50/p99 latency and requests/sec of serve')
+    loadtest.add_argument('--url', default='http://127.0.0.1:8765', help='service base URL')
+    loadtest.add_argument('--duration', type=float, default=10.0, help='seconds to run (default: 10)')
+    loadtest.add_argument('--concurrency', type=int, default=8, help='parallel connections (default: 8)')
+    loadtest.set_defaults(func=cmd_loadtest)
+
+    bench = subparsers.add_parser('bench', help='measure cold-start time of lightweight commands')
+    bench.add_argument('--runs', type=int, default=5, help='runs per command (default: 5)')
+    bench.add_argument('--budget', type=float, default=DEFAULT_BUDGET,
+                       help=f'median cold-start budget in seconds (default: {DEFAULT_BUDGET})')
+    bench.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    config = load_config(args.config)
+    try:
+        return args.func(args, config)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
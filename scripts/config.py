@@ -0,0 +1,58 @@
+import json
+import os
+
+# Project root is the folder above scripts/
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Default settings (override with a JSON config file or environment variables)
+DEFAULT_CONFIG = {
+    'raw_csv': os.path.join(PROJECT_ROOT, 'data', 'Parking_Tags_Data_2024_1.csv'),
+    'cleaned_csv': os.path.join(PROJECT_ROOT, 'data', 'parking_tickets_cleaned.csv'),
+    'visuals_dir': os.path.join(PROJECT_ROOT, 'visuals'),
+    'sql_outputs_dir': os.path.join(PROJECT_ROOT, 'sql_outputs'),
+    'mysql': {
+        'host': 'localhost',
+        'user': 'root',
+        'password': '1234567890',
+        'database': 'toronto_parking_db'
+    }
+}
+
+# Environment variables that override a single setting
+ENV_OVERRIDES = {
+    'PARKING_RAW_CSV': ('raw_csv',),
+    'PARKING_CLEANED_CSV': ('cleaned_csv',),
+    'PARKING_VISUALS_DIR': ('visuals_dir',),
+    'PARKING_SQL_OUTPUTS_DIR': ('sql_outputs_dir',),
+    'PARKING_MYSQL_HOST': ('mysql', 'host'),
+    'PARKING_MYSQL_USER': ('mysql', 'user'),
+    'PARKING_MYSQL_PASSWORD': ('mysql', 'password'),
+    'PARKING_MYSQL_DATABASE': ('mysql', 'database'),
+}
+
+
+def load_config(path=None):
+    """Load settings: defaults, then JSON file (path or $PARKING_CONFIG), then env vars"""
+    config = dict(DEFAULT_CONFIG)
+    config['mysql'] = dict(DEFAULT_CONFIG['mysql'])
+
+    path = path or os.environ.get('PARKING_CONFIG')
+    if path:
+        with open(os.path.expanduser(path)) as f:
+            overrides = json.load(f)
+        config['mysql'].update(overrides.pop('mysql', {}))
+        config.update(overrides)
+
+    for env_name, keys in ENV_OVERRIDES.items():
+        value = os.environ.get(env_name)
+        if value is None:
+            continue
+        if len(keys) == 1:
+            config[keys[0]] = value
+        else:
+            config[keys[0]][keys[1]] = value
+
+    for key in ('raw_csv', 'cleaned_csv', 'visuals_dir', 'sql_outputs_dir'):
+        config[key] = os.path.expanduser(config[key])
+
+    return config
@@ -1,13 +1,6 @@
 import pandas as pd
 import os
 
-# Define your file path
-data_path = os.path.expanduser("/Users/shrey0107/Desktop/toronto-parking-analysis/data/Parking_Tags_Data_2024_1.csv")
-
-# Load dataset
-print("Loading data...")
-df = pd.read_csv(data_path)
-
 # steps
 # # Show basic info
 # print("\n--- Dataset Info ---")
@@ -16,16 +9,8 @@ df = pd.read_csv(data_path)
 # print("\n--- Sample Data ---")
 # print(df.head())
 
-# # Save a small cleaned version for testing
-# cleaned_path = os.path.expanduser("~/Desktop/toronto-parking-analysis/data/parking_tickets_cleaned.csv")
-# df.to_csv(cleaned_path, index=False)
-
-# print(f"\nCleaned file saved to: {cleaned_path}")
 # --- Data Cleaning Section ---
 
-# Convert date_of_infraction to datetime
-df['date_of_infraction'] = pd.to_datetime(df['date_of_infraction'], format='%Y%m%d', errors='coerce')
-
 # Clean time_of_infraction (convert float like 915.0 -> 09:15)
 def format_time(t):
     try:
@@ -34,20 +19,47 @@ def format_time(t):
     except:
         return None
 
-df['time_of_infraction'] = df['time_of_infraction'].apply(format_time)
 
-# Merge location columns into a single column
-df['full_location'] = df[['location1', 'location2', 'location3', 'location4']].fillna('').agg(' '.join, axis=1).str.strip()
+def clean_data(df):
+    """Clean raw parking tag data and return the cleaned DataFrame"""
+    # Convert date_of_infraction to datetime
+    df['date_of_infraction'] = pd.to_datetime(df['date_of_infraction'], format='%Y%m%d', errors='coerce')
+
+    df['time_of_infraction'] = df['time_of_infraction'].apply(format_time)
+
+    # Merge location columns into a single column
+    df['full_location'] = df[['location1', 'location2', 'location3', 'location4']].fillna('').agg(' '.join, axis=1).str.strip()
+
+    # Drop unnecessary columns
+    df = df.drop(columns=['tag_number_masked', 'location1', 'location2', 'location3', 'location4', 'province'])
+    return df
+
+
+def run_cleaning(data_path, cleaned_path):
+    """Load the raw CSV, clean it and save the cleaned CSV"""
+    # Load dataset
+    print("Loading data...")
+    df = pd.read_csv(data_path)
+
+    df = clean_data(df)
+
+    # Preview the cleaned data
+    print("\n--- Cleaned Data Preview ---")
+    print(df.head())
+
+    # Save cleaned dataset (write a temp file, then swap it in so readers
+    # like query_service.py never see a half-written CSV)
+    os.makedirs(os.path.dirname(cleaned_path) or '.', exist_ok=True)
+    tmp_path = cleaned_path + '.tmp'
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, cleaned_path)
 
-# Drop unnecessary columns
-df = df.drop(columns=['tag_number_masked', 'location1', 'location2', 'location3', 'location4', 'province'])
+    print(f"\n✅ Cleaned file saved to: {cleaned_path}")
+    return df
 
-# Preview the cleaned data
-print("\n--- Cleaned Data Preview ---")
-print(df.head())
 
-# Save cleaned dataset
-cleaned_path = os.path.expanduser("~/Desktop/toronto-parking-analysis/data/parking_tickets_cleaned.csv")
-df.to_csv(cleaned_path, index=False)
+if __name__ == "__main__":
+    from config import load_config
 
-print(f"\n✅ Cleaned file saved to: {cleaned_path}")
+    config = load_config()
+    run_cleaning(config['raw_csv'], config['cleaned_csv'])
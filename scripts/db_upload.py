@@ -1,36 +1,32 @@
 import pandas as pd
 import mysql.connector
 from mysql.connector import Error
+from config import DEFAULT_CONFIG, load_config
 
-# MySQL Configuration
-MYSQL_CONFIG = {
-    'host': 'localhost',
-    'user': 'root',
-    'password': '1234567890',  
-    'database': 'toronto_parking_db'
-}
+# MySQL Configuration (defaults; pass mysql_config to override)
+MYSQL_CONFIG = DEFAULT_CONFIG['mysql']
 
-def create_database():
+def create_database(mysql_config=MYSQL_CONFIG):
     """Step 1: Create the database if it doesn't exist"""
     try:
         conn = mysql.connector.connect(
-            host=MYSQL_CONFIG['host'],
-            user=MYSQL_CONFIG['user'],
-            password=MYSQL_CONFIG['password']
+            host=mysql_config['host'],
+            user=mysql_config['user'],
+            password=mysql_config['password']
         )
         cursor = conn.cursor()
-        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {MYSQL_CONFIG['database']}")
-        print(f"✓ Database '{MYSQL_CONFIG['database']}' created/verified")
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {mysql_config['database']}")
+        print(f"✓ Database '{mysql_config['database']}' created/verified")
         cursor.close()
         conn.close()
     except Error as e:
         print(f"✗ Error creating database: {e}")
         raise
 
-def create_table():
+def create_table(mysql_config=MYSQL_CONFIG):
     """Step 2: Create the parking_tickets table"""
     try:
-        conn = mysql.connector.connect(**MYSQL_CONFIG)
+        conn = mysql.connector.connect(**mysql_config)
         cursor = conn.cursor()
         
         create_table_query = """
@@ -56,17 +52,16 @@ def create_table():
         print(f"✗ Error creating table: {e}")
         raise
 
-def upload_data():
+def upload_data(csv_path=DEFAULT_CONFIG['cleaned_csv'], mysql_config=MYSQL_CONFIG):
     """Step 3: Upload cleaned CSV data to MySQL"""
     try:
         # Read CSV file
-        csv_path = 'data/parking_tickets_cleaned.csv'
         df = pd.read_csv(csv_path)
         
         print(f"📊 Loaded {len(df)} records from CSV")
         
         # Connect to database
-        conn = mysql.connector.connect(**MYSQL_CONFIG)
+        conn = mysql.connector.connect(**mysql_config)
         cursor = conn.cursor()
         
         # SQL insert statement
@@ -106,10 +101,10 @@ def upload_data():
         print(f"✗ CSV file not found at {csv_path}")
         raise
 
-def verify_upload():
+def verify_upload(mysql_config=MYSQL_CONFIG):
     """Step 4: Verify data was uploaded correctly"""
     try:
-        conn = mysql.connector.connect(**MYSQL_CONFIG)
+        conn = mysql.connector.connect(**mysql_config)
         cursor = conn.cursor()
         
         # Count total records
@@ -131,15 +126,20 @@ def verify_upload():
         print(f"✗ Error verifying upload: {e}")
         raise
 
+def run_upload(csv_path=DEFAULT_CONFIG['cleaned_csv'], mysql_config=MYSQL_CONFIG):
+    """Run all 4 upload steps"""
+    create_database(mysql_config)
+    create_table(mysql_config)
+    upload_data(csv_path, mysql_config)
+    verify_upload(mysql_config)
+
 if __name__ == "__main__":
     print("🚗 Toronto Parking Analysis - Database Upload\n")
     
     try:
-        create_database()
-        create_table()
-        upload_data()
-        verify_upload()
+        config = load_config()
+        run_upload(config['cleaned_csv'], config['mysql'])
         print("\n✅ Upload complete!")
     except Exception as e:
         print(f"\n❌ Upload failed: {e}")
-        exit(1)
\ No newline at end of file
+        exit(1)
@@ -0,0 +1,114 @@
+"""Toronto Parking Analysis - load test for the aggregate query service
+
+Hammers a running query_service.py with the dashboard polls (one keep-alive
+connection per worker thread) and reports requests/sec and p50/p99 latency.
+
+Usage:
+    python scripts/cli.py serve &
+    python scripts/load_test.py --duration 10 --concurrency 8
+"""
+import argparse
+import http.client
+import math
+import threading
+import time
+from urllib.parse import urlparse
+
+# What the dashboards poll: unfiltered and filtered versions of each aggregate
+DEFAULT_PATHS = [
+    '/top-infractions?limit=10',
+    '/top-infractions?limit=15&fine_range=Under%20$50',
+    '/by-date',
+    '/by-date?fine_range=Over%20$150',
+    '/fine-distribution',
+    '/fine-distribution?start=2024-01-08&end=2024-01-14',
+    '/by-ward',
+]
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _worker(host, port, paths, offset, deadline, latencies, errors):
+    conn = http.client.HTTPConnection(host, port, timeout=10)
+    i = offset
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(f"{response.status} {path}")
+                continue
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(f"{type(e).__name__} {path}")
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+
+
+def run_load_test(url='http://127.0.0.1:8765', duration=10.0, concurrency=8, paths=DEFAULT_PATHS):
+    """Run the load test and return a dict with requests/sec and latency percentiles (ms)"""
+    parsed = urlparse(url)
+    deadline = time.perf_counter() + duration
+    latencies, errors = [], []
+
+    threads = [
+        threading.Thread(target=_worker,
+                         args=(parsed.hostname, parsed.port or 80, paths, n, deadline, latencies, errors))
+        for n in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'requests_per_sec': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'max_ms': (latencies[-1] if latencies else 0.0) * 1000,
+        'sample_errors': errors[:5],
+    }
+
+
+def print_report(result, duration, concurrency):
+    print(f"⏱  Load test: {duration:.0f}s, {concurrency} connections\n")
+    print(f"  Requests:      {result['requests']}")
+    print(f"  Errors:        {result['errors']}")
+    print(f"  Requests/sec:  {result['requests_per_sec']:.1f}")
+    print(f"  p50 latency:   {result['p50_ms']:.2f} ms")
+    print(f"  p99 latency:   {result['p99_ms']:.2f} ms")
+    print(f"  max latency:   {result['max_ms']:.2f} ms")
+    for error in result['sample_errors']:
+        print(f"  ✗ {error}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Load test the aggregate query service')
+    parser.add_argument('--url', default='http://127.0.0.1:8765', help='service base URL')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds to run (default: 10)')
+    parser.add_argument('--concurrency', type=int, default=8, help='parallel connections (default: 8)')
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    result = run_load_test(args.url, args.duration, args.concurrency)
+    print_report(result, args.duration, args.concurrency)
+    exit(1 if result['errors'] else 0)
@@ -137,8 +137,10 @@ class TorontoParkingDB:
         return self.query_to_dataframe(query)
 
 if __name__ == "__main__":
+    from config import load_config
+
     # Test: Try connecting and running a query
-    db = TorontoParkingDB(password='1234567890')
+    db = TorontoParkingDB(**load_config()['mysql'])
     db.connect()
     
     print("\n📊 Summary Statistics:")
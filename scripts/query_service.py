@@ -0,0 +1,346 @@
+"""Toronto Parking Analysis - local aggregate query service
+
+Serves the same aggregates as TorontoParkingDB (top infractions, by date,
+fine distribution, by ward) over HTTP/JSON, but from an in-memory rollup of
+the cleaned CSV instead of a MySQL GROUP BY per request.
+
+Endpoints (GET, all accept ?start=YYYY-MM-DD&end=YYYY-MM-DD&code=<infraction_code>&fine_range=<bucket>):
+    /top-infractions?limit=10
+    /by-date
+    /fine-distribution
+    /by-ward
+    /health             (no filters; snapshot info)
+POST /refresh reloads the CSV now. The CSV is also watched and reloaded when
+a new cleaned file lands; the new snapshot replaces the old one in one step.
+"""
+import json
+import math
+import os
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Same buckets (and order) as TorontoParkingDB.get_fine_distribution()
+FINE_RANGES = ['$100-$150', '$50-$100', 'Over $150', 'Under $50']
+
+# Filtered results kept per snapshot (unfiltered results are always precomputed)
+CACHE_SIZE = 1024
+
+# Rollup row layout: one row per (date, code, description, fine_range, ward)
+DATE, CODE, DESCRIPTION, FINE_RANGE, WARD, COUNT, FINE_SUM, FINE_N = range(8)
+
+
+def fine_range(amount):
+    """Bucket a fine amount like the CASE in get_fine_distribution()"""
+    if amount is None:
+        return None
+    if amount < 50:
+        return 'Under $50'
+    if amount < 100:
+        return '$50-$100'
+    if amount < 150:
+        return '$100-$150'
+    return 'Over $150'
+
+
+def _avg(fine_sum, fine_n):
+    return round(fine_sum / fine_n, 2) if fine_n else None
+
+
+def _value(v):
+    """Convert pandas/numpy missing values and scalars to plain Python"""
+    if v is None or (isinstance(v, float) and math.isnan(v)):
+        return None
+    return v.item() if hasattr(v, 'item') else v
+
+
+# ============================================
+# IN-MEMORY HOT TABLES
+# ============================================
+
+class HotTables:
+    """Immutable snapshot of the rollup with precomputed unfiltered aggregates"""
+
+    def __init__(self, rollup, source=None):
+        """rollup: list of (date, code, description, fine_range, ward, count, fine_sum, fine_n)"""
+        self.rollup = rollup
+        self.source = source
+        self.loaded_at = datetime.now().isoformat(timespec='seconds')
+        self.total_tickets = sum(row[COUNT] for row in rollup)
+        self._cache = {}
+
+        # Warm the cache with what dashboards poll most: no filters
+        for name in ('by-date', 'fine-distribution', 'by-ward'):
+            self.query(name)
+        self.query('top-infractions', limit=10)
+
+    def query(self, name, start=None, end=None, code=None, fine_range=None, limit=10):
+        """Return the aggregate `name` as a list of dicts (cached per filter set)"""
+        key = (name, start, end, code, fine_range, limit if name == 'top-infractions' else None)
+        result = self._cache.get(key)
+        if result is None:
+            rows = self._filter(start, end, code, fine_range)
+            result = QUERIES[name](self, rows, limit)
+            if len(self._cache) < CACHE_SIZE:
+                self._cache[key] = result
+        return result
+
+    def _filter(self, start, end, code, fine_range):
+        rows = self.rollup
+        if start or end:
+            rows = [r for r in rows if r[DATE] is not None
+                    and (not start or r[DATE] >= start) and (not end or r[DATE] <= end)]
+        if code is not None:
+            rows = [r for r in rows if r[CODE] == code]
+        if fine_range:
+            rows = [r for r in rows if r[FINE_RANGE] == fine_range]
+        return rows
+
+    def _group(self, rows, column):
+        groups = {}
+        for r in rows:
+            g = groups.get(r[column])
+            if g is None:
+                groups[r[column]] = [r[COUNT], r[FINE_SUM], r[FINE_N]]
+            else:
+                g[0] += r[COUNT]
+                g[1] += r[FINE_SUM]
+                g[2] += r[FINE_N]
+        return groups
+
+    def top_infractions(self, rows, limit):
+        """Like get_top_infractions(): count and avg fine per description"""
+        groups = self._group(rows, DESCRIPTION)
+        top = sorted(groups.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        return [{'infraction_description': desc, 'count': count, 'avg_fine': _avg(fine_sum, fine_n)}
+                for desc, (count, fine_sum, fine_n) in top]
+
+    def by_date(self, rows, limit):
+        """Like get_by_date(): count per date"""
+        groups = self._group([r for r in rows if r[DATE] is not None], DATE)
+        return [{'date': date, 'count': groups[date][0]} for date in sorted(groups)]
+
+    def fine_distribution(self, rows, limit):
+        """Like get_fine_distribution(): count per fine range"""
+        groups = self._group([r for r in rows if r[FINE_RANGE] is not None], FINE_RANGE)
+        return [{'fine_range': fr, 'count': groups[fr][0]} for fr in FINE_RANGES if fr in groups]
+
+    def by_ward(self, rows, limit):
+        """Like get_by_ward(): count and avg fine per ward"""
+        groups = self._group([r for r in rows if r[WARD] is not None], WARD)
+        ordered = sorted(groups.items(), key=lambda item: item[1][0], reverse=True)
+        return [{'ward': ward, 'count': count, 'avg_fine': _avg(fine_sum, fine_n)}
+                for ward, (count, fine_sum, fine_n) in ordered]
+
+    def info(self):
+        return {
+            'source': self.source,
+            'loaded_at': self.loaded_at,
+            'total_tickets': self.total_tickets,
+            'rollup_rows': len(self.rollup),
+        }
+
+
+QUERIES = {
+    'top-infractions': HotTables.top_infractions,
+    'by-date': HotTables.by_date,
+    'fine-distribution': HotTables.fine_distribution,
+    'by-ward': HotTables.by_ward,
+}
+
+
+def build_rollup(df):
+    """Group cleaned ticket rows into rollup tuples (one pandas groupby at load time)"""
+    import pandas as pd
+
+    fines = pd.to_numeric(df['set_fine_amount'], errors='coerce')
+    keys = pd.DataFrame({
+        'date': pd.to_datetime(df['date_of_infraction'], errors='coerce').dt.strftime('%Y-%m-%d'),
+        'code': pd.to_numeric(df['infraction_code'], errors='coerce').astype('Int64'),
+        'description': df['infraction_description'],
+        'fine_range': fines.map(lambda v: None if pd.isna(v) else fine_range(v)),
+        'ward': df['ward'] if 'ward' in df.columns else None,
+        'fine': fines,
+    })
+    grouped = keys.groupby(['date', 'code', 'description', 'fine_range', 'ward'], dropna=False)['fine'].agg(
+        ['size', 'sum', 'count']).reset_index()
+
+    return [
+        (_value(date), None if pd.isna(code) else int(code), _value(desc), _value(fr), _value(ward),
+         int(size), float(fine_sum), int(fine_n))
+        for date, code, desc, fr, ward, size, fine_sum, fine_n in grouped.itertuples(index=False)
+    ]
+
+
+def load_hot_tables(csv_path):
+    """Read the cleaned CSV and build a new HotTables snapshot"""
+    import pandas as pd
+
+    df = pd.read_csv(csv_path, low_memory=False)
+    return HotTables(build_rollup(df), source=csv_path)
+
+
+# ============================================
+# HTTP SERVICE
+# ============================================
+
+class QueryService:
+    """Holds the current snapshot and swaps it when the cleaned CSV changes"""
+
+    def __init__(self, csv_path, watch_interval=5.0):
+        self.csv_path = csv_path
+        self.watch_interval = watch_interval
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._loaded_signature = self._signature()
+        self._pending_signature = None
+        self.tables = load_hot_tables(csv_path)
+
+    def _signature(self):
+        stat = os.stat(self.csv_path)
+        return (stat.st_mtime, stat.st_size)
+
+    def refresh(self, force=False):
+        """Rebuild off to the side, then replace the snapshot in one assignment
+
+        Without force, a changed CSV is only loaded once its mtime and size
+        have stayed the same for two polls, so a file still being written
+        is never picked up half-done.
+        """
+        with self._reload_lock:
+            signature = self._signature()
+            if not force:
+                if signature == self._loaded_signature:
+                    self._pending_signature = None
+                    return False
+                if signature != self._pending_signature:
+                    # Changed since the last poll: wait for it to settle
+                    self._pending_signature = signature
+                    return False
+            self.tables = load_hot_tables(self.csv_path)
+            self._loaded_signature = signature
+            self._pending_signature = None
+            print(f"✓ Reloaded {self.tables.total_tickets} tickets from {self.csv_path}")
+            return True
+
+    def _watch(self):
+        while not self._stop.wait(self.watch_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep serving the old snapshot (e.g. file mid-write)
+                print(f"✗ Reload failed: {e}")
+
+    def start_watcher(self):
+        if self.watch_interval > 0:
+            threading.Thread(target=self._watch, daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+
+def parse_filters(query_string):
+    """Turn the query string into HotTables.query() keyword arguments"""
+    params = {k: v[-1] for k, v in parse_qs(query_string).items()}
+    filters = {
+        'start': params.get('start'),
+        'end': params.get('end'),
+        'code': int(params['code']) if params.get('code') else None,
+        'fine_range': params.get('fine_range'),
+        'limit': int(params.get('limit', 10)),
+    }
+    if filters['limit'] < 1:
+        raise ValueError("limit must be at least 1")
+    # Normalise dates so comparisons and cache keys match the rollup's 'YYYY-MM-DD'
+    for key in ('start', 'end'):
+        if filters[key]:
+            filters[key] = datetime.strptime(filters[key], '%Y-%m-%d').date().isoformat()
+    if filters['fine_range'] and filters['fine_range'] not in FINE_RANGES:
+        raise ValueError(f"fine_range must be one of {FINE_RANGES}")
+    return filters
+
+
+def make_handler(service, quiet=True):
+    """Build a request handler class bound to `service`"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are separate writes; without this keep-alive
+        # clients wait ~40ms per request on delayed ACKs
+        disable_nagle_algorithm = True
+
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            name = url.path.strip('/')
+            # Take the snapshot once so one request never mixes two loads
+            tables = service.tables
+
+            if name == 'health':
+                self._send(200, tables.info())
+                return
+            if name not in QUERIES:
+                self._send(404, {'error': f"unknown endpoint '/{name}'", 'endpoints': sorted(QUERIES)})
+                return
+            try:
+                filters = parse_filters(url.query)
+            except ValueError as e:
+                self._send(400, {'error': str(e)})
+                return
+            self._send(200, tables.query(name, **filters))
+
+        def do_POST(self):
+            # Drain any body so keep-alive doesn't read it as the next request
+            length = int(self.headers.get('Content-Length', 0) or 0)
+            if length:
+                self.rfile.read(length)
+            if urlparse(self.path).path.strip('/') != 'refresh':
+                self._send(404, {'error': 'only POST /refresh is supported'})
+                return
+            try:
+                service.refresh(force=True)
+            except Exception as e:
+                self._send(500, {'error': str(e)})
+                return
+            self._send(200, service.tables.info())
+
+        def log_message(self, format, *args):
+            if not quiet:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def serve(csv_path, host='127.0.0.1', port=8765, watch_interval=5.0, quiet=True):
+    """Load the hot tables and serve them until Ctrl+C"""
+    started = time.perf_counter()
+    service = QueryService(csv_path, watch_interval=watch_interval)
+    print(f"✓ Loaded {service.tables.total_tickets} tickets "
+          f"({len(service.tables.rollup)} rollup rows) in {time.perf_counter() - started:.2f}s")
+
+    server = ThreadingHTTPServer((host, port), make_handler(service, quiet=quiet))
+    server.daemon_threads = True
+    service.start_watcher()
+    print(f"🚗 Serving aggregates on http://{host}:{port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✓ Stopped")
+    finally:
+        service.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    from config import load_config
+
+    serve(load_config()['cleaned_csv'])